@@ -5,8 +5,9 @@ This module defines custom exception classes and FastAPI exception handlers
 to provide standardized error responses across the API.
 """
 from typing import Any, Dict, Optional
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
@@ -19,7 +20,16 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 class GHGPlatformException(Exception):
-    """Base exception class for all GHG Platform custom exceptions"""
+    """
+    Base exception class for all GHG Platform custom exceptions
+    
+    Attributes live in __slots__, so raising one does not fill an
+    instance __dict__. Subclasses declare an empty __slots__ and their
+    fixed error code and HTTP status as ERROR_CODE / STATUS_CODE, and
+    their message template as a prebound str.format_map.
+    """
+    
+    __slots__ = ("message", "error_code", "status_code", "details")
     
     def __init__(
         self,
@@ -47,6 +57,17 @@ class FactorNotFoundException(GHGPlatformException):
     Requirements: 1.3 - Historical accuracy requires valid factors for all dates
     """
     
+    __slots__ = ()
+    
+    ERROR_CODE = "FACTOR_NOT_FOUND"
+    STATUS_CODE = status.HTTP_404_NOT_FOUND
+    
+    _format_message = (
+        "No emission factor found for activity '{activity_name}' "
+        "(Scope {scope}) on date {activity_date}. "
+        "Please ensure a valid emission factor exists for this activity and date."
+    ).format_map
+    
     def __init__(
         self,
         activity_name: str,
@@ -59,19 +80,14 @@ class FactorNotFoundException(GHGPlatformException):
             "scope": scope,
             "activity_date": activity_date
         }
+        message = self._format_message(error_details)
         if details:
             error_details.update(details)
         
-        message = (
-            f"No emission factor found for activity '{activity_name}' "
-            f"(Scope {scope}) on date {activity_date}. "
-            f"Please ensure a valid emission factor exists for this activity and date."
-        )
-        
         super().__init__(
             message=message,
-            error_code="FACTOR_NOT_FOUND",
-            status_code=status.HTTP_404_NOT_FOUND,
+            error_code=self.ERROR_CODE,
+            status_code=self.STATUS_CODE,
             details=error_details
         )
 
@@ -88,6 +104,17 @@ class NoProductionDataException(GHGPlatformException):
     Requirements: 3.5 - Intensity calculation requires production data
     """
     
+    __slots__ = ()
+    
+    ERROR_CODE = "NO_PRODUCTION_DATA"
+    STATUS_CODE = status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    _format_message = (
+        "No production data found for metric '{metric_name}' "
+        "in the period from {start_date} to {end_date}. "
+        "Emission intensity cannot be calculated without production data."
+    ).format_map
+    
     def __init__(
         self,
         metric_name: str,
@@ -100,19 +127,14 @@ class NoProductionDataException(GHGPlatformException):
             "start_date": start_date,
             "end_date": end_date
         }
+        message = self._format_message(error_details)
         if details:
             error_details.update(details)
         
-        message = (
-            f"No production data found for metric '{metric_name}' "
-            f"in the period from {start_date} to {end_date}. "
-            f"Emission intensity cannot be calculated without production data."
-        )
-        
         super().__init__(
             message=message,
-            error_code="NO_PRODUCTION_DATA",
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error_code=self.ERROR_CODE,
+            status_code=self.STATUS_CODE,
             details=error_details
         )
 
@@ -130,6 +152,16 @@ class InvalidDateRangeException(GHGPlatformException):
     Requirements: 4.1 - API endpoints must validate input parameters
     """
     
+    __slots__ = ()
+    
+    ERROR_CODE = "INVALID_DATE_RANGE"
+    STATUS_CODE = status.HTTP_400_BAD_REQUEST
+    
+    _format_message = (
+        "Invalid date range: {reason}. "
+        "Start date: {start_date}, End date: {end_date}"
+    ).format_map
+    
     def __init__(
         self,
         start_date: str,
@@ -142,18 +174,14 @@ class InvalidDateRangeException(GHGPlatformException):
             "end_date": end_date,
             "reason": reason
         }
+        message = self._format_message(error_details)
         if details:
             error_details.update(details)
         
-        message = (
-            f"Invalid date range: {reason}. "
-            f"Start date: {start_date}, End date: {end_date}"
-        )
-        
         super().__init__(
             message=message,
-            error_code="INVALID_DATE_RANGE",
-            status_code=status.HTTP_400_BAD_REQUEST,
+            error_code=self.ERROR_CODE,
+            status_code=self.STATUS_CODE,
             details=error_details
         )
 
@@ -163,11 +191,18 @@ class DatabaseConnectionException(GHGPlatformException):
     Exception raised when database connection or query fails.
     """
     
+    __slots__ = ()
+    
+    ERROR_CODE = "DATABASE_ERROR"
+    STATUS_CODE = status.HTTP_503_SERVICE_UNAVAILABLE
+    
+    _format_message = "Database error: {message}".format_map
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
-            message=f"Database error: {message}",
-            error_code="DATABASE_ERROR",
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=self._format_message({"message": message}),
+            error_code=self.ERROR_CODE,
+            status_code=self.STATUS_CODE,
             details=details or {}
         )
 
@@ -179,20 +214,26 @@ class InvalidScopeException(GHGPlatformException):
     Valid scopes are 1, 2, or 3 according to GHG Protocol.
     """
     
+    __slots__ = ()
+    
+    ERROR_CODE = "INVALID_SCOPE"
+    STATUS_CODE = status.HTTP_400_BAD_REQUEST
+    
+    _format_message = (
+        "Invalid scope value: {provided_scope}. "
+        "Scope must be 1 (Direct), 2 (Indirect - Energy), or 3 (Indirect - Other)."
+    ).format_map
+    
     def __init__(self, scope: Any, details: Optional[Dict[str, Any]] = None):
         error_details = {"provided_scope": scope, "valid_scopes": [1, 2, 3]}
+        message = self._format_message(error_details)
         if details:
             error_details.update(details)
         
-        message = (
-            f"Invalid scope value: {scope}. "
-            f"Scope must be 1 (Direct), 2 (Indirect - Energy), or 3 (Indirect - Other)."
-        )
-        
         super().__init__(
             message=message,
-            error_code="INVALID_SCOPE",
-            status_code=status.HTTP_400_BAD_REQUEST,
+            error_code=self.ERROR_CODE,
+            status_code=self.STATUS_CODE,
             details=error_details
         )
 
@@ -233,7 +274,7 @@ def format_error_response(
 async def ghg_platform_exception_handler(
     request: Request,
     exc: GHGPlatformException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handler for all custom GHG Platform exceptions.
     
@@ -244,7 +285,7 @@ async def ghg_platform_exception_handler(
         extra={"details": exc.details, "path": request.url.path}
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=format_error_response(
             error_code=exc.error_code,
@@ -257,24 +298,30 @@ async def ghg_platform_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handler for Pydantic validation errors.
     
-    Converts validation errors into standardized format.
+    Converts validation errors into standardized format. The response
+    only carries each error's loc and type; the full Pydantic errors
+    (msg, input, ctx) are logged.
     """
+    errors = exc.errors()
     logger.warning(
         f"Validation error on {request.url.path}",
-        extra={"errors": exc.errors()}
+        extra={"errors": errors}
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=format_error_response(
             error_code="VALIDATION_ERROR",
             message="Request validation failed",
             details={
-                "validation_errors": exc.errors(),
+                "validation_errors": [
+                    {"loc": error["loc"], "type": error["type"]}
+                    for error in errors
+                ],
                 "body": exc.body if hasattr(exc, 'body') else None
             }
         )
@@ -284,7 +331,7 @@ async def validation_exception_handler(
 async def http_exception_handler(
     request: Request,
     exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handler for standard HTTP exceptions.
     
@@ -294,7 +341,7 @@ async def http_exception_handler(
         f"HTTP {exc.status_code} on {request.url.path}: {exc.detail}"
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=format_error_response(
             error_code=f"HTTP_{exc.status_code}",
@@ -304,15 +351,28 @@ async def http_exception_handler(
     )
 
 
+# The 500 body only varies in its details, so the code/message part is
+# serialized once at import time and the details are spliced in per request
+_INTERNAL_ERROR_DETAILS_PLACEHOLDER = b'{"__details__":null}'
+_INTERNAL_ERROR_BODY_HEAD, _INTERNAL_ERROR_BODY_TAIL = orjson.dumps(
+    format_error_response(
+        error_code="INTERNAL_SERVER_ERROR",
+        message="An unexpected error occurred. Please try again later.",
+        details={"__details__": None}
+    )
+).split(_INTERNAL_ERROR_DETAILS_PLACEHOLDER)
+
+
 async def unhandled_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> Response:
     """
     Handler for unexpected/unhandled exceptions.
     
     Logs the full exception and returns a generic error response
-    to avoid exposing internal details.
+    to avoid exposing internal details. Only the request details are
+    serialized per call; the rest of the body is precomputed.
     """
     logger.error(
         f"Unhandled exception on {request.url.path}: {str(exc)}",
@@ -320,16 +380,15 @@ async def unhandled_exception_handler(
         extra={"path": request.url.path, "method": request.method}
     )
     
-    return JSONResponse(
+    details = orjson.dumps({
+        "path": request.url.path,
+        "method": request.method
+    })
+    
+    return Response(
+        content=_INTERNAL_ERROR_BODY_HEAD + details + _INTERNAL_ERROR_BODY_TAIL,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=format_error_response(
-            error_code="INTERNAL_SERVER_ERROR",
-            message="An unexpected error occurred. Please try again later.",
-            details={
-                "path": request.url.path,
-                "method": request.method
-            }
-        )
+        media_type="application/json"
     )
 
 
@@ -2,10 +2,16 @@
 Repositories Package
 Exports all repository classes for data access
 """
+from app.repositories.protocols import (
+    EmissionRepositoryProtocol,
+    BusinessMetricsRepositoryProtocol,
+)
 from app.repositories.emission_repository import EmissionRepository
 from app.repositories.business_metrics_repository import BusinessMetricsRepository
 
 __all__ = [
     'EmissionRepository',
     'BusinessMetricsRepository',
+    'EmissionRepositoryProtocol',
+    'BusinessMetricsRepositoryProtocol',
 ]
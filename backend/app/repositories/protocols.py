@@ -0,0 +1,63 @@
+"""
+Repository Protocols Module
+Declares the interfaces the repository classes implement
+"""
+from datetime import date
+from typing import Optional, List, Dict, Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class EmissionRepositoryProtocol(Protocol):
+    """
+    Interface for emission data access.
+    Lets type checkers verify implementations and test doubles.
+    """
+
+    def get_valid_factor(
+        self,
+        activity_name: str,
+        scope: int,
+        activity_date: date
+    ) -> Optional[Dict[str, Any]]:
+        ...
+
+    def get_emissions_by_year_and_scope(
+        self,
+        years: List[int]
+    ) -> List[Dict[str, Any]]:
+        ...
+
+    def get_total_emissions_for_period(
+        self,
+        start_date: date,
+        end_date: date
+    ) -> Dict[str, Any]:
+        ...
+
+    def get_emissions_by_source(
+        self,
+        filters: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        ...
+
+    def get_monthly_emissions(self, year: int) -> List[Dict[str, Any]]:
+        ...
+
+
+@runtime_checkable
+class BusinessMetricsRepositoryProtocol(Protocol):
+    """
+    Interface for business metrics data access.
+    Lets type checkers verify implementations and test doubles.
+    """
+
+    def get_metric_total_for_period(
+        self,
+        metric_name: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[Dict[str, Any]]:
+        ...
+
+    def get_available_metrics(self) -> List[Dict[str, Any]]:
+        ...
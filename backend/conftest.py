@@ -0,0 +1,41 @@
+"""
+Pytest configuration and fixtures shared by the backend unit tests
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from app.exceptions import register_exception_handlers
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--smoke",
+        action="store_true",
+        default=False,
+        help="also run smoke-marked tests (deselected by default)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Deselect smoke-marked tests unless --smoke is given or -m names them
+    Done here rather than with an addopts -m, which any command-line -m replaces
+    """
+    if config.getoption("--smoke") or "smoke" in (config.option.markexpr or ""):
+        return
+    
+    deselected = [item for item in items if item.get_closest_marker("smoke")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("smoke")]
+
+
+@pytest.fixture(scope="session")
+def exception_app() -> FastAPI:
+    """
+    FastAPI app with the platform exception handlers registered (session-scoped)
+    """
+    app = FastAPI(default_response_class=ORJSONResponse)
+    register_exception_handlers(app)
+    return app
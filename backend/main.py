@@ -4,6 +4,7 @@ Carbon Emissions Platform - Main Application Entry Point
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import init_database, close_database, db_pool
@@ -19,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 # Create FastAPI application with comprehensive OpenAPI documentation
 app = FastAPI(
+    default_response_class=ORJSONResponse,
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="""
@@ -15,11 +15,13 @@ Usage:
     python scripts/import_ghg_data.py
 """
 
+import io
 import sys
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 
 # Add parent directory to path for imports
@@ -33,6 +35,13 @@ except ImportError:
     print("Please install: pip install pandas openpyxl")
     sys.exit(1)
 
+# Prefer the Rust-based calamine reader (pandas >= 2.2); openpyxl is the fallback
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 from app.database import get_db_cursor, execute_query, execute_transaction
 from app.config import settings
 
@@ -43,6 +52,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Unlogged staging table that emission records are written to before being
+# moved into emission_records in a single statement
+STAGE_TABLE = '_stage_records'
+
+# Columns written for every emission record, in COPY order
+RECORD_COLUMNS = [
+    'factor_id', 'activity_date', 'activity_name', 'scope',
+    'activity_value', 'activity_unit', 'calculated_co2e',
+    'location', 'department', 'notes', 'created_by'
+]
+
 
 class GHGDataImporter:
     """Handles import of GHG emissions data from Excel file."""
@@ -61,6 +81,10 @@ class GHGDataImporter:
             'business_metrics': 0,
             'errors': []
         }
+        # Per-factor record frames from all sheets, written with one COPY
+        self.pending_records: List[pd.DataFrame] = []
+        # Sheets being read in the background, keyed by sheet name
+        self.sheet_futures: Dict[str, Future] = {}
     
     def run(self):
         """Execute the complete import process."""
@@ -75,9 +99,21 @@ class GHGDataImporter:
             
             logger.info(f"Reading data from: {self.excel_file_path}")
             
+            # Read sheets in the background so the next sheet is parsed while
+            # the current one's factors are written to the database
+            reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheet-reader')
+            self.sheet_futures = {
+                sheet_name: reader.submit(self._read_excel_sheet, sheet_name)
+                for sheet_name in ('Scope 1', 'Scope 2', 'Scope 3')
+            }
+            reader.shutdown(wait=False)
+            
             # Clear existing sample data
             self.clear_sample_data()
             
+            # Stage records in an unlogged table to skip WAL during the load
+            self.create_staging_table()
+            
             # Import Scope 1 data
             logger.info("\n" + "=" * 60)
             logger.info("Processing Scope 1 Data")
@@ -96,6 +132,9 @@ class GHGDataImporter:
             logger.info("=" * 60)
             self.import_scope3_data()
             
+            # Move staged records into emission_records
+            self.load_staged_records()
+            
             # Print summary
             self.print_summary()
             
@@ -107,6 +146,9 @@ class GHGDataImporter:
             logger.error(f"Import failed: {str(e)}")
             self.stats['errors'].append(str(e))
             raise
+        
+        finally:
+            self.drop_staging_table()
     
     def clear_sample_data(self):
         """Clear existing sample data from database."""
@@ -125,15 +167,137 @@ class GHGDataImporter:
         except Exception as e:
             logger.error(f"Failed to clear sample data: {str(e)}")
             raise
+    
+    def create_staging_table(self):
+        """
+        Create the unlogged staging table for emission records.
+        
+        Columns use unbounded numeric/text types so that the COPY never
+        fails on a single bad row; rows that would violate the
+        emission_records column limits are filtered out when the staged
+        records are loaded.
+        """
+        execute_transaction([
+            (f"DROP TABLE IF EXISTS {STAGE_TABLE}", ()),
+            (
+                f"""
+                CREATE UNLOGGED TABLE {STAGE_TABLE} (
+                    factor_id INT,
+                    activity_date DATE,
+                    activity_name TEXT,
+                    scope INT,
+                    activity_value NUMERIC,
+                    activity_unit TEXT,
+                    calculated_co2e NUMERIC,
+                    location TEXT,
+                    department TEXT,
+                    notes TEXT,
+                    created_by TEXT
+                )
+                """,
+                ()
+            ),
+        ])
+        logger.debug(f"Created staging table {STAGE_TABLE}")
+    
+    def stage_records(
+        self,
+        records: pd.DataFrame,
+        factor_id: int,
+        activity_name: str,
+        scope: int
+    ):
+        """
+        Queue the records of one emission factor group for loading.
+        
+        Rows with a zero activity value are dropped, as they carry no emissions.
+        """
+        records = records[records['activity_value'] != 0]
+        self.pending_records.append(records.assign(
+            factor_id=factor_id,
+            activity_name=activity_name,
+            scope=scope,
+            created_by='import_script'
+        ))
+    
+    def load_staged_records(self):
+        """
+        Write all queued records with a single COPY, then move them into
+        emission_records in one transaction.
+        """
+        logger.info("Loading staged emission records...")
+        
+        if self.pending_records:
+            all_records = pd.concat(self.pending_records, ignore_index=True)
+            buffer = io.StringIO()
+            all_records[RECORD_COLUMNS].to_csv(buffer, index=False, header=False, na_rep='\\N')
+            buffer.seek(0)
+            
+            with get_db_cursor(commit=True) as cursor:
+                cursor.copy_expert(
+                    f"COPY {STAGE_TABLE} ({', '.join(RECORD_COLUMNS)}) "
+                    f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                    buffer
+                )
+            staged = len(all_records)
+        else:
+            staged = 0
+        
+        columns = ', '.join(RECORD_COLUMNS)
+        with get_db_cursor(commit=True) as cursor:
+            # Skip rows that would overflow NUMERIC(15, 4) / VARCHAR columns or
+            # violate the non-negative CHECK constraints
+            cursor.execute(f"""
+                INSERT INTO emission_records ({columns})
+                SELECT {columns}
+                FROM {STAGE_TABLE}
+                WHERE activity_value BETWEEN 0 AND 99999999999.9999
+                  AND calculated_co2e BETWEEN 0 AND 99999999999.9999
+                  AND length(activity_name) <= 255
+                  AND length(activity_unit) <= 50
+                  AND coalesce(length(location), 0) <= 255
+                  AND coalesce(length(department), 0) <= 100
+            """)
+            self.stats['emission_records'] = cursor.rowcount
+            cursor.execute(f"DROP TABLE {STAGE_TABLE}")
+            cursor.execute("ANALYZE emission_records")
+        
+        skipped = staged - self.stats['emission_records']
+        if skipped:
+            logger.warning(f"Skipped {skipped} emission records that do not fit the schema")
+        logger.info(f"✓ Loaded {self.stats['emission_records']} emission records")
+    
+    def drop_staging_table(self):
+        """Drop the staging table if an import left it behind."""
+        try:
+            execute_transaction([(f"DROP TABLE IF EXISTS {STAGE_TABLE}", ())])
+        except Exception as e:
+            logger.warning(f"Failed to drop staging table {STAGE_TABLE}: {str(e)}")
 
     
     def import_scope1_data(self):
         """Import Scope 1 (Direct Emissions) data."""
         try:
             # Read Scope 1 sheet
-            df = pd.read_excel(self.excel_file_path, sheet_name='Scope 1')
+            df = self.read_sheet('Scope 1')
             logger.info(f"Read {len(df)} rows from Scope 1 sheet")
             
+            # Build record columns for the whole sheet up front
+            quantity_column = 'Q1 Quantity' if 'Q1 Quantity' in df.columns else 'Q2 Quantity'
+            records = pd.DataFrame({
+                'activity_date': self._map_unique(
+                    self._text_column(df, 'Year/Timeline', 'Q1'),
+                    lambda quarter: self.parse_quarter_to_date(quarter, 2024)
+                ),
+                'activity_value': self._numeric_column(df, quantity_column),
+                # Convert tCO2 to kgCO2e
+                'calculated_co2e': self._numeric_column(df, 'GHG Emission (tCO2)') * 1000,
+                'activity_unit': self._text_column(df, 'Unit of Material', ''),
+                'location': self._text_column(df, 'Location (Plant)', missing='Central Steel Plant'),
+                'department': self._text_column(df, 'Section', missing='Unknown'),
+                'notes': None,
+            }, index=df.index)
+            
             # Group by unique emission factors
             factor_groups = df.groupby(['Material', 'Emission Factor', 'Unit of Emission Factor'])
             
@@ -155,9 +319,8 @@ class GHGDataImporter:
                 )
                 
                 if factor_id:
-                    # Create emission records for this factor
-                    for _, row in group.iterrows():
-                        self.create_scope1_emission_record(row, factor_id)
+                    # Queue emission records for this factor
+                    self.stage_records(records.loc[group.index], factor_id, str(material), scope=1)
             
             logger.info(f"✓ Scope 1 import complete")
             
@@ -169,9 +332,24 @@ class GHGDataImporter:
         """Import Scope 2 (Indirect Energy Emissions) data."""
         try:
             # Read Scope 2 sheet
-            df = pd.read_excel(self.excel_file_path, sheet_name='Scope 2')
+            df = self.read_sheet('Scope 2')
             logger.info(f"Read {len(df)} rows from Scope 2 sheet")
             
+            # Build record columns for the whole sheet up front
+            records = pd.DataFrame({
+                'activity_date': self._map_unique(
+                    self._text_column(df, 'Quarter', 'Q1'),
+                    lambda quarter: self.parse_quarter_to_date(quarter, 2024)
+                ),
+                'activity_value': self._numeric_column(df, 'Energy Consumed'),
+                # Convert tCO2 to kgCO2e
+                'calculated_co2e': self._numeric_column(df, 'Scope 2 Emissions (tCO₂)') * 1000,
+                'activity_unit': self._text_column(df, 'Unit', ''),
+                'location': 'Central Steel Plant',
+                'department': self._text_column(df, 'Section/Process', missing='Unknown'),
+                'notes': None,
+            }, index=df.index)
+            
             # Group by unique emission factors
             factor_groups = df.groupby(['Energy Type', 'Emission Factor (tCO₂/unit)', 'Unit'])
             
@@ -193,9 +371,8 @@ class GHGDataImporter:
                 )
                 
                 if factor_id:
-                    # Create emission records for this factor
-                    for _, row in group.iterrows():
-                        self.create_scope2_emission_record(row, factor_id)
+                    # Queue emission records for this factor
+                    self.stage_records(records.loc[group.index], factor_id, str(energy_type), scope=2)
             
             logger.info(f"✓ Scope 2 import complete")
             
@@ -207,9 +384,25 @@ class GHGDataImporter:
         """Import Scope 3 (Value Chain Emissions) data."""
         try:
             # Read Scope 3 sheet
-            df = pd.read_excel(self.excel_file_path, sheet_name='Scope 3')
+            df = self.read_sheet('Scope 3')
             logger.info(f"Read {len(df)} rows from Scope 3 sheet")
             
+            # Build record columns for the whole sheet up front
+            vendor = self._text_column(df, 'Vendor Involved')
+            records = pd.DataFrame({
+                'activity_date': self._map_unique(
+                    df['Month'] if 'Month' in df.columns else pd.Series('2024-01', index=df.index),
+                    self.parse_month_to_date
+                ),
+                'activity_value': self._numeric_column(df, 'Quantity'),
+                # Convert tCO2 to kgCO2e
+                'calculated_co2e': self._numeric_column(df, 'Scope 3 Emissions (tCO2)') * 1000,
+                'activity_unit': self._text_column(df, 'Unit of Activity', ''),
+                'location': 'Central Steel Plant',
+                'department': self._text_column(df, 'Scope 3 Category', missing='Unknown'),
+                'notes': ('Vendor: ' + vendor.fillna('')).where(vendor.notna(), None),
+            }, index=df.index)
+            
             # Group by unique emission factors
             factor_groups = df.groupby(['Activity Description', 'Emission Factor (tCO2/unit)', 'Unit of Activity'])
             
@@ -231,9 +424,8 @@ class GHGDataImporter:
                 )
                 
                 if factor_id:
-                    # Create emission records for this factor
-                    for _, row in group.iterrows():
-                        self.create_scope3_emission_record(row, factor_id)
+                    # Queue emission records for this factor
+                    self.stage_records(records.loc[group.index], factor_id, str(activity_desc), scope=3)
             
             logger.info(f"✓ Scope 3 import complete")
             
@@ -242,6 +434,22 @@ class GHGDataImporter:
             self.stats['errors'].append(f"Scope 3: {str(e)}")
 
     
+    def read_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """
+        Read a single sheet from the Excel workbook.
+        
+        Returns the background read started by run() when there is one,
+        otherwise reads the sheet directly.
+        """
+        future = self.sheet_futures.pop(sheet_name, None)
+        if future is not None:
+            return future.result()
+        return self._read_excel_sheet(sheet_name)
+    
+    def _read_excel_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """Parse one sheet; formula cells are read from their cached values."""
+        return pd.read_excel(self.excel_file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+    
     def create_emission_factor(
         self,
         activity_name: str,
@@ -285,160 +493,34 @@ class GHGDataImporter:
             logger.warning(f"Failed to create emission factor '{activity_name}': {str(e)}")
             return None
     
-    def create_scope1_emission_record(self, row: pd.Series, factor_id: int):
-        """Create emission record from Scope 1 data row."""
-        try:
-            # Parse quarter to date
-            quarter = row.get('Year/Timeline', 'Q1')
-            activity_date = self.parse_quarter_to_date(quarter, 2024)
-            
-            # Get quantity (try Q1 and Q2 columns)
-            quantity = row.get('Q1 Quantity', row.get('Q2 Quantity', 0))
-            if pd.isna(quantity) or quantity == 0:
-                return
-            
-            # Get calculated emissions
-            ghg_emission = row.get('GHG Emission (tCO2)', 0)
-            if pd.isna(ghg_emission):
-                ghg_emission = 0
-            
-            # Convert tCO2 to kgCO2e
-            calculated_co2e = float(ghg_emission) * 1000
-            
-            # Get location and section
-            location = row.get('Location (Plant)', 'Central Steel Plant')
-            department = row.get('Section', 'Unknown')
-            
-            self.create_emission_record(
-                factor_id=factor_id,
-                activity_date=activity_date,
-                activity_name=str(row.get('Material', 'Unknown')),
-                scope=1,
-                activity_value=float(quantity),
-                activity_unit=str(row.get('Unit of Material', '')),
-                calculated_co2e=calculated_co2e,
-                location=str(location) if not pd.isna(location) else None,
-                department=str(department) if not pd.isna(department) else None
-            )
-            
-        except Exception as e:
-            logger.debug(f"Skipped Scope 1 record: {str(e)}")
+    def _numeric_column(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """Coerce a sheet column to float, treating blanks and text as 0."""
+        if column not in df.columns:
+            return pd.Series(0.0, index=df.index)
+        return pd.to_numeric(df[column], errors='coerce').fillna(0.0)
     
-    def create_scope2_emission_record(self, row: pd.Series, factor_id: int):
-        """Create emission record from Scope 2 data row."""
-        try:
-            # Parse quarter to date
-            quarter = row.get('Quarter', 'Q1')
-            activity_date = self.parse_quarter_to_date(quarter, 2024)
-            
-            # Get energy consumed
-            energy_consumed = row.get('Energy Consumed', 0)
-            if pd.isna(energy_consumed) or energy_consumed == 0:
-                return
-            
-            # Get calculated emissions
-            scope2_emissions = row.get('Scope 2 Emissions (tCO₂)', 0)
-            if pd.isna(scope2_emissions):
-                scope2_emissions = 0
-            
-            # Convert tCO2 to kgCO2e
-            calculated_co2e = float(scope2_emissions) * 1000
-            
-            # Get location and section
-            location = 'Central Steel Plant'
-            department = row.get('Section/Process', 'Unknown')
-            
-            self.create_emission_record(
-                factor_id=factor_id,
-                activity_date=activity_date,
-                activity_name=str(row.get('Energy Type', 'Unknown')),
-                scope=2,
-                activity_value=float(energy_consumed),
-                activity_unit=str(row.get('Unit', '')),
-                calculated_co2e=calculated_co2e,
-                location=location,
-                department=str(department) if not pd.isna(department) else None
-            )
-            
-        except Exception as e:
-            logger.debug(f"Skipped Scope 2 record: {str(e)}")
+    def _map_unique(self, values: pd.Series, parse: Callable[[Any], Any]) -> pd.Series:
+        """Apply ``parse`` once per distinct value rather than once per row."""
+        return values.map({value: parse(value) for value in values.unique()})
     
-    def create_scope3_emission_record(self, row: pd.Series, factor_id: int):
-        """Create emission record from Scope 3 data row."""
-        try:
-            # Parse month to date
-            month_str = row.get('Month', '2024-01')
-            activity_date = self.parse_month_to_date(month_str)
-            
-            # Get quantity
-            quantity = row.get('Quantity', 0)
-            if pd.isna(quantity) or quantity == 0:
-                return
-            
-            # Get calculated emissions
-            scope3_emissions = row.get('Scope 3 Emissions (tCO2)', 0)
-            if pd.isna(scope3_emissions):
-                scope3_emissions = 0
-            
-            # Convert tCO2 to kgCO2e
-            calculated_co2e = float(scope3_emissions) * 1000
-            
-            # Get category and vendor
-            category = row.get('Scope 3 Category', 'Unknown')
-            vendor = row.get('Vendor Involved', None)
-            
-            self.create_emission_record(
-                factor_id=factor_id,
-                activity_date=activity_date,
-                activity_name=str(row.get('Activity Description', 'Unknown')),
-                scope=3,
-                activity_value=float(quantity),
-                activity_unit=str(row.get('Unit of Activity', '')),
-                calculated_co2e=calculated_co2e,
-                location='Central Steel Plant',
-                department=str(category) if not pd.isna(category) else None,
-                notes=f"Vendor: {vendor}" if not pd.isna(vendor) else None
-            )
-            
-        except Exception as e:
-            logger.debug(f"Skipped Scope 3 record: {str(e)}")
-
-    
-    def create_emission_record(
+    def _text_column(
         self,
-        factor_id: int,
-        activity_date: date,
-        activity_name: str,
-        scope: int,
-        activity_value: float,
-        activity_unit: str,
-        calculated_co2e: float,
-        location: Optional[str] = None,
-        department: Optional[str] = None,
-        notes: Optional[str] = None
-    ):
-        """Create an emission record in the database."""
-        try:
-            query = """
-                INSERT INTO emission_records (
-                    factor_id, activity_date, activity_name, scope,
-                    activity_value, activity_unit, calculated_co2e,
-                    location, department, notes, created_by
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            with get_db_cursor(commit=True) as cursor:
-                cursor.execute(query, (
-                    factor_id, activity_date, activity_name, scope,
-                    activity_value, activity_unit, calculated_co2e,
-                    location, department, notes, 'import_script'
-                ))
-                
-                self.stats['emission_records'] += 1
-                
-        except Exception as e:
-            logger.debug(f"Failed to create emission record: {str(e)}")
+        df: pd.DataFrame,
+        column: str,
+        default: Optional[str] = None,
+        *,
+        missing: Optional[str] = None
+    ) -> pd.Series:
+        """
+        Coerce a sheet column to str, replacing blanks with ``default``.
+        
+        A sheet without the column gets ``missing`` (or ``default``) on every row.
+        """
+        if column not in df.columns:
+            fill = default if missing is None else missing
+            return pd.Series(fill, index=df.index, dtype=object)
+        values = df[column]
+        return values.astype(str).where(values.notna(), default)
     
     def parse_activity_unit(self, unit_str: str) -> str:
         """Parse and standardize activity unit from emission factor unit."""
@@ -0,0 +1,91 @@
+"""
+Tests for the GHG workbook importer
+Verifies record building from sheet frames without a database
+"""
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def importer(monkeypatch):
+    """Importer that reads sheets from a dict and fakes factor creation"""
+    from scripts.import_ghg_data import GHGDataImporter
+
+    importer = GHGDataImporter("unused.xlsx")
+    importer.sheets = {}
+    monkeypatch.setattr(importer, 'read_sheet', lambda name: importer.sheets[name])
+    monkeypatch.setattr(importer, 'create_emission_factor', lambda **kwargs: 1)
+    return importer
+
+
+def staged(importer):
+    assert not importer.stats['errors']
+    return pd.concat(importer.pending_records)
+
+
+def test_scope1_missing_location_and_section_use_defaults(importer):
+    """Sheets without Location (Plant)/Section fall back to the old defaults"""
+    importer.sheets['Scope 1'] = pd.DataFrame({
+        'Material': ['Diesel'],
+        'Emission Factor': [2.68],
+        'Unit of Emission Factor': ['tCO2/KL'],
+        'Q1 Quantity': [10.0],
+        'GHG Emission (tCO2)': [26.8],
+    })
+
+    importer.import_scope1_data()
+    records = staged(importer)
+
+    assert records['location'].tolist() == ['Central Steel Plant']
+    assert records['department'].tolist() == ['Unknown']
+
+
+def test_scope2_missing_section_uses_default(importer):
+    """Sheets without Section/Process fall back to 'Unknown'"""
+    importer.sheets['Scope 2'] = pd.DataFrame({
+        'Energy Type': ['Grid Electricity'],
+        'Emission Factor (tCO₂/unit)': [0.00082],
+        'Unit': ['kWh'],
+        'Energy Consumed': [1000.0],
+        'Scope 2 Emissions (tCO₂)': [0.82],
+    })
+
+    importer.import_scope2_data()
+
+    assert staged(importer)['department'].tolist() == ['Unknown']
+
+
+def test_scope3_missing_category_uses_default(importer):
+    """Sheets without Scope 3 Category fall back to 'Unknown'"""
+    importer.sheets['Scope 3'] = pd.DataFrame({
+        'Activity Description': ['Road freight'],
+        'Emission Factor (tCO2/unit)': [0.0001],
+        'Unit of Activity': ['tkm'],
+        'Quantity': [500.0],
+        'Scope 3 Emissions (tCO2)': [0.05],
+    })
+
+    importer.import_scope3_data()
+
+    assert staged(importer)['department'].tolist() == ['Unknown']
+
+
+def test_blank_cells_stay_null(importer):
+    """A present column with blank cells still imports NULL, as before"""
+    importer.sheets['Scope 1'] = pd.DataFrame({
+        'Material': ['Diesel'],
+        'Emission Factor': [2.68],
+        'Unit of Emission Factor': ['tCO2/KL'],
+        'Q1 Quantity': [10.0],
+        'GHG Emission (tCO2)': [26.8],
+        'Location (Plant)': [None],
+        'Section': [None],
+    })
+
+    importer.import_scope1_data()
+    records = staged(importer)
+
+    assert records['location'].isna().all()
+    assert records['department'].isna().all()
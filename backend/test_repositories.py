@@ -2,80 +2,41 @@
 Test script to verify repository implementations
 This script tests the repository methods with mock data
 """
-from datetime import date
+import inspect
+
+import pytest
+
+
+pytestmark = pytest.mark.structure
+
+
+def assert_matches_protocol(repo, protocol):
+    """Check each protocol method exists on repo with the same parameter names"""
+    # Subclassing would make isinstance pass and fill gaps with the stubs
+    assert protocol not in type(repo).__mro__
+    assert isinstance(repo, protocol)
+    
+    for name, member in vars(protocol).items():
+        if name.startswith('_') or not callable(member):
+            continue
+        assert hasattr(repo, name), f"missing {name}"
+        expected = list(inspect.signature(member).parameters)[1:]
+        actual = list(inspect.signature(getattr(repo, name)).parameters)
+        assert actual == expected, f"{name} parameters {actual} != {expected}"
+
 
-# Mock test to verify method signatures and logic structure
 def test_emission_repository_structure():
-    """Verify EmissionRepository has all required methods"""
-    from app.repositories.emission_repository import EmissionRepository
-    
-    repo = EmissionRepository()
-    
-    # Check all required methods exist
-    assert hasattr(repo, 'get_valid_factor')
-    assert hasattr(repo, 'get_emissions_by_year_and_scope')
-    assert hasattr(repo, 'get_total_emissions_for_period')
-    assert hasattr(repo, 'get_emissions_by_source')
-    
-    print("✓ EmissionRepository has all required methods")
-    
-    # Verify method signatures
-    import inspect
-    
-    # get_valid_factor signature
-    sig = inspect.signature(repo.get_valid_factor)
-    params = list(sig.parameters.keys())
-    assert 'activity_name' in params
-    assert 'scope' in params
-    assert 'activity_date' in params
-    print("✓ get_valid_factor has correct signature")
+    """Verify EmissionRepository implements EmissionRepositoryProtocol"""
+    from app.repositories import EmissionRepository, EmissionRepositoryProtocol
     
-    # get_emissions_by_year_and_scope signature
-    sig = inspect.signature(repo.get_emissions_by_year_and_scope)
-    params = list(sig.parameters.keys())
-    assert 'years' in params
-    print("✓ get_emissions_by_year_and_scope has correct signature")
-    
-    # get_total_emissions_for_period signature
-    sig = inspect.signature(repo.get_total_emissions_for_period)
-    params = list(sig.parameters.keys())
-    assert 'start_date' in params
-    assert 'end_date' in params
-    print("✓ get_total_emissions_for_period has correct signature")
-    
-    # get_emissions_by_source signature
-    sig = inspect.signature(repo.get_emissions_by_source)
-    params = list(sig.parameters.keys())
-    assert 'filters' in params
-    print("✓ get_emissions_by_source has correct signature")
+    assert_matches_protocol(EmissionRepository(), EmissionRepositoryProtocol)
 
 
 def test_business_metrics_repository_structure():
-    """Verify BusinessMetricsRepository has all required methods"""
-    from app.repositories.business_metrics_repository import BusinessMetricsRepository
-    
-    repo = BusinessMetricsRepository()
-    
-    # Check all required methods exist
-    assert hasattr(repo, 'get_metric_total_for_period')
-    assert hasattr(repo, 'get_available_metrics')
-    
-    print("✓ BusinessMetricsRepository has all required methods")
-    
-    # Verify method signatures
-    import inspect
+    """Verify BusinessMetricsRepository implements BusinessMetricsRepositoryProtocol"""
+    from app.repositories import BusinessMetricsRepository, BusinessMetricsRepositoryProtocol
     
-    # get_metric_total_for_period signature
-    sig = inspect.signature(repo.get_metric_total_for_period)
-    params = list(sig.parameters.keys())
-    assert 'metric_name' in params
-    assert 'start_date' in params
-    assert 'end_date' in params
-    print("✓ get_metric_total_for_period has correct signature")
-    
-    # get_available_metrics signature
-    sig = inspect.signature(repo.get_available_metrics)
-    print("✓ get_available_metrics has correct signature")
+    assert_matches_protocol(BusinessMetricsRepository(), BusinessMetricsRepositoryProtocol)
 
 
 def test_repository_exports():
@@ -84,26 +45,3 @@ def test_repository_exports():
     
     assert EmissionRepository is not None
     assert BusinessMetricsRepository is not None
-    
-    print("✓ Repositories are properly exported from package")
-
-
-if __name__ == "__main__":
-    print("Testing Repository Layer Implementation\n")
-    print("=" * 50)
-    
-    try:
-        test_emission_repository_structure()
-        print()
-        test_business_metrics_repository_structure()
-        print()
-        test_repository_exports()
-        print()
-        print("=" * 50)
-        print("✓ All repository structure tests passed!")
-        print("\nNote: Database integration tests require a running PostgreSQL instance.")
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
@@ -2,13 +2,25 @@
 Pytest configuration and fixtures for integration tests
 Provides test database setup, fixtures, and helper functions
 """
+import bisect
+import csv
+import io
 import os
+import weakref
 import pytest
 import psycopg2
 from psycopg2 import pool
-from psycopg2.extensions import connection as Connection
+from psycopg2.extras import execute_values
+from psycopg2.extensions import (
+    ISOLATION_LEVEL_AUTOCOMMIT,
+    TRANSACTION_STATUS_INERROR,
+    connection as Connection,
+    cursor as Cursor,
+)
 from datetime import date, datetime, timedelta
-from typing import Generator, Dict, List, Any
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Generator, Dict, List, Any, Mapping, NamedTuple, Optional, Tuple
 from contextlib import contextmanager
 
 # Test database configuration
@@ -20,17 +32,130 @@ TEST_DB_CONFIG = {
     "password": os.getenv("TEST_DB_PASSWORD", "1234"),
 }
 
+# Under pytest-xdist each worker runs against its own clone of the schema
+# template, so workers never contend for the same rows or locks
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    TEST_DB_CONFIG["database"] = f"{TEST_DB_CONFIG['database']}_{XDIST_WORKER}"
+
+
+TRUNCATE_TEST_TABLES_SQL = """
+    SET session_replication_role = 'replica';
+    TRUNCATE TABLE audit_log, emission_records, business_metrics,
+                   emission_factors, emission_categories, reporting_periods
+        RESTART IDENTITY CASCADE;
+    SET session_replication_role = 'origin';
+"""
+
+
+class SavepointConnection(Connection):
+    """
+    Connection that keeps a running test inside a single outer transaction
+    
+    While in_test is set, commit() and rollback() only act on the test_sp
+    savepoint, so helpers that commit still leave nothing behind once
+    db_connection rolls back to it.
+    """
+    
+    in_test = False
+    
+    def commit(self):
+        if not self.in_test:
+            return super().commit()
+        with self.cursor() as cursor:
+            cursor.execute("RELEASE SAVEPOINT test_sp; SAVEPOINT test_sp")
+    
+    def rollback(self):
+        if not self.in_test:
+            return super().rollback()
+        with self.cursor() as cursor:
+            cursor.execute("ROLLBACK TO SAVEPOINT test_sp")
+
 
 @pytest.fixture(scope="session")
-def test_db_pool() -> Generator[pool.ThreadedConnectionPool, None, None]:
+def worker_database() -> Generator[None, None, None]:
+    """
+    Clone a private test database for this xdist worker (no-op otherwise)
+    The clone is made from the template built by setup_test_db.py and is
+    dropped again when the session ends
+    """
+    if not XDIST_WORKER:
+        yield
+        return
+    
+    from tests.setup_test_db import ADMIN_DB_CONFIG, TEMPLATE_DB_NAME, terminate_connections
+    
+    database = TEST_DB_CONFIG["database"]
+    conn = psycopg2.connect(**ADMIN_DB_CONFIG)
+    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"DROP DATABASE IF EXISTS {database}")
+        cursor.execute(f"CREATE DATABASE {database} TEMPLATE {TEMPLATE_DB_NAME}")
+        yield
+        terminate_connections(cursor, database)
+        cursor.execute(f"DROP DATABASE {database}")
+    finally:
+        cursor.close()
+        conn.close()
+
+
+# Tables init.sql must create; checked by the session smoke check and by
+# TestDatabaseSetup.test_tables_exist
+REQUIRED_TABLES = (
+    "emission_factors",
+    "emission_records",
+    "business_metrics",
+    "audit_log",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_smoke_check(worker_database) -> None:
+    """
+    Check once per session that the test database is reachable and has the
+    schema, instead of in every run of the smoke-marked TestDatabaseSetup
+    Runs before test_db_pool empties the tables, so a missing schema is
+    reported as such rather than as a failed TRUNCATE
+    """
+    conn = psycopg2.connect(**TEST_DB_CONFIG)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = 'public'
+            AND table_name = ANY(%s)
+        """, (list(REQUIRED_TABLES),))
+        found_tables = {row[0] for row in cursor.fetchall()}
+    finally:
+        conn.close()
+    
+    missing_tables = set(REQUIRED_TABLES) - found_tables
+    if missing_tables:
+        pytest.fail(
+            f"Test database is missing tables {sorted(missing_tables)}; "
+            "run python tests/setup_test_db.py",
+            pytrace=False
+        )
+
+
+@pytest.fixture(scope="session")
+def test_db_pool(database_smoke_check) -> Generator[pool.ThreadedConnectionPool, None, None]:
     """
     Create a connection pool for the test database (session-scoped)
+    Empties all tables once so every test starts from an empty database
     """
     db_pool = pool.ThreadedConnectionPool(
         minconn=1,
         maxconn=10,
+        connection_factory=SavepointConnection,
         **TEST_DB_CONFIG
     )
+    with get_test_connection(db_pool) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(TRUNCATE_TEST_TABLES_SQL)
+        conn.commit()
     yield db_pool
     db_pool.closeall()
 
@@ -47,66 +172,86 @@ def get_test_connection(db_pool: pool.ThreadedConnectionPool) -> Generator[Conne
         db_pool.putconn(conn)
 
 
-@pytest.fixture(scope="function")
-def db_connection(test_db_pool: pool.ThreadedConnectionPool) -> Generator[Connection, None, None]:
+@pytest.fixture(scope="session")
+def session_connection(test_db_pool: pool.ThreadedConnectionPool) -> Generator[Connection, None, None]:
     """
-    Provide a database connection for each test function
-    Automatically rolls back changes after each test
+    Hold one connection and one outer transaction for the whole session
+    Nothing is ever committed; the transaction is rolled back at the end
     """
     with get_test_connection(test_db_pool) as conn:
-        # Start a transaction
         conn.autocommit = False
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+
+
+@contextmanager
+def test_savepoint(conn: Connection) -> Generator[Connection, None, None]:
+    """
+    Run a block under a savepoint and roll back to it afterwards
+    
+    Helper commits move the inner test_sp savepoint forward, so the
+    rollback targets the outer test_tx savepoint, which stays put.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SAVEPOINT test_tx; SAVEPOINT test_sp")
+    conn.in_test = True
+    try:
+        yield conn
+    finally:
+        conn.in_test = False
+        with conn.cursor() as cursor:
+            cursor.execute("ROLLBACK TO SAVEPOINT test_tx; RELEASE SAVEPOINT test_tx")
+
+
+@pytest.fixture(scope="function")
+def db_connection(session_connection: Connection) -> Generator[Connection, None, None]:
+    """
+    Provide the session connection to each test function
+    Runs the test under a savepoint and rolls everything back afterwards,
+    so no per-test TRUNCATE or reconnect is needed
+    """
+    with test_savepoint(session_connection) as conn:
         yield conn
-        # Rollback after test
-        conn.rollback()
 
 
 @pytest.fixture(scope="function")
-def clean_database(db_connection: Connection):
+def empty_database(db_connection: Connection):
     """
-    Clean all tables before each test
+    Empty all tables for a test that must not see any other rows
+    The TRUNCATE runs inside the test transaction and is rolled back with it
     """
     cursor = db_connection.cursor()
-    
-    # Disable triggers temporarily for faster cleanup
-    cursor.execute("SET session_replication_role = 'replica';")
-    
-    # Delete data from all tables in reverse dependency order
-    tables = [
-        "audit_log",
-        "emission_records",
-        "business_metrics",
-        "emission_factors",
-        "emission_categories",
-        "reporting_periods"
-    ]
-    
-    for table in tables:
-        cursor.execute(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE;")
-    
-    # Re-enable triggers
-    cursor.execute("SET session_replication_role = 'origin';")
-    
+    cursor.execute(TRUNCATE_TEST_TABLES_SQL)
     db_connection.commit()
     cursor.close()
 
 
+def _frozen(rows: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Freeze session-shared sample data so no test can modify it for the others
+    """
+    return tuple(MappingProxyType(row) for row in rows)
+
+
 # ============================================================================
 # Test Data Fixtures - Emission Factors
 # ============================================================================
 
-@pytest.fixture
-def sample_emission_factors() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="session")
+def sample_emission_factors() -> Tuple[Mapping[str, Any], ...]:
     """
     Sample emission factors with versioning for testing historical accuracy
+    Built once per session and frozen (read-only mappings), so it is shared
     """
-    return [
+    return _frozen([
         # Diesel - Multiple versions showing factor changes over time
         {
             "activity_name": "Diesel",
             "scope": 1,
             "activity_unit": "litres",
-            "co2e_per_unit": 2.68,
+            "co2e_per_unit": Decimal("2.68"),
             "source": "EPA 2022",
             "valid_from": date(2022, 1, 1),
             "valid_to": date(2022, 12, 31),
@@ -116,7 +261,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Diesel",
             "scope": 1,
             "activity_unit": "litres",
-            "co2e_per_unit": 2.71,
+            "co2e_per_unit": Decimal("2.71"),
             "source": "EPA 2023",
             "valid_from": date(2023, 1, 1),
             "valid_to": date(2023, 12, 31),
@@ -126,7 +271,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Diesel",
             "scope": 1,
             "activity_unit": "litres",
-            "co2e_per_unit": 2.73,
+            "co2e_per_unit": Decimal("2.73"),
             "source": "EPA 2024",
             "valid_from": date(2024, 1, 1),
             "valid_to": None,  # Currently active
@@ -137,7 +282,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Natural Gas",
             "scope": 1,
             "activity_unit": "m3",
-            "co2e_per_unit": 2.03,
+            "co2e_per_unit": Decimal("2.03"),
             "source": "IPCC 2006",
             "valid_from": date(2022, 1, 1),
             "valid_to": date(2023, 12, 31),
@@ -147,7 +292,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Natural Gas",
             "scope": 1,
             "activity_unit": "m3",
-            "co2e_per_unit": 2.05,
+            "co2e_per_unit": Decimal("2.05"),
             "source": "IPCC 2024",
             "valid_from": date(2024, 1, 1),
             "valid_to": None,
@@ -158,7 +303,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Grid Electricity",
             "scope": 2,
             "activity_unit": "kWh",
-            "co2e_per_unit": 0.45,
+            "co2e_per_unit": Decimal("0.45"),
             "source": "CEA India 2023",
             "valid_from": date(2023, 1, 1),
             "valid_to": date(2023, 12, 31),
@@ -168,7 +313,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Grid Electricity",
             "scope": 2,
             "activity_unit": "kWh",
-            "co2e_per_unit": 0.42,
+            "co2e_per_unit": Decimal("0.42"),
             "source": "CEA India 2024",
             "valid_from": date(2024, 1, 1),
             "valid_to": None,
@@ -179,7 +324,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Petrol",
             "scope": 1,
             "activity_unit": "litres",
-            "co2e_per_unit": 2.31,
+            "co2e_per_unit": Decimal("2.31"),
             "source": "EPA 2024",
             "valid_from": date(2024, 1, 1),
             "valid_to": None,
@@ -190,7 +335,7 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Coal",
             "scope": 1,
             "activity_unit": "tonnes",
-            "co2e_per_unit": 2419.00,
+            "co2e_per_unit": Decimal("2419.00"),
             "source": "IPCC 2006",
             "valid_from": date(2022, 1, 1),
             "valid_to": None,
@@ -201,26 +346,27 @@ def sample_emission_factors() -> List[Dict[str, Any]]:
             "activity_name": "Air Travel",
             "scope": 3,
             "activity_unit": "km",
-            "co2e_per_unit": 0.255,
+            "co2e_per_unit": Decimal("0.255"),
             "source": "DEFRA 2024",
             "valid_from": date(2024, 1, 1),
             "valid_to": None,
             "created_by": "test_system"
         }
-    ]
+    ])
 
 
-@pytest.fixture
-def sample_business_metrics() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="session")
+def sample_business_metrics() -> Tuple[Mapping[str, Any], ...]:
     """
     Sample business metrics for intensity calculations
+    Built once per session and frozen (read-only mappings), so it is shared
     """
-    return [
+    return _frozen([
         # Production metrics for 2023
         {
             "metric_name": "Tons of Steel Produced",
             "metric_category": "Production",
-            "value": 45000.00,
+            "value": Decimal("45000.00"),
             "unit": "tons",
             "metric_date": date(2023, 1, 31),
             "reporting_period": "Monthly",
@@ -229,7 +375,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Tons of Steel Produced",
             "metric_category": "Production",
-            "value": 48000.00,
+            "value": Decimal("48000.00"),
             "unit": "tons",
             "metric_date": date(2023, 2, 28),
             "reporting_period": "Monthly",
@@ -238,7 +384,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Tons of Steel Produced",
             "metric_category": "Production",
-            "value": 47500.00,
+            "value": Decimal("47500.00"),
             "unit": "tons",
             "metric_date": date(2023, 3, 31),
             "reporting_period": "Monthly",
@@ -248,7 +394,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Tons of Steel Produced",
             "metric_category": "Production",
-            "value": 50000.00,
+            "value": Decimal("50000.00"),
             "unit": "tons",
             "metric_date": date(2024, 1, 31),
             "reporting_period": "Monthly",
@@ -257,7 +403,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Tons of Steel Produced",
             "metric_category": "Production",
-            "value": 52000.00,
+            "value": Decimal("52000.00"),
             "unit": "tons",
             "metric_date": date(2024, 2, 29),
             "reporting_period": "Monthly",
@@ -266,7 +412,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Tons of Steel Produced",
             "metric_category": "Production",
-            "value": 51000.00,
+            "value": Decimal("51000.00"),
             "unit": "tons",
             "metric_date": date(2024, 3, 31),
             "reporting_period": "Monthly",
@@ -276,7 +422,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Number of Employees",
             "metric_category": "Operational",
-            "value": 1200.00,
+            "value": Decimal("1200.00"),
             "unit": "employees",
             "metric_date": date(2023, 12, 31),
             "reporting_period": "Annual",
@@ -285,7 +431,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Number of Employees",
             "metric_category": "Operational",
-            "value": 1250.00,
+            "value": Decimal("1250.00"),
             "unit": "employees",
             "metric_date": date(2024, 12, 31),
             "reporting_period": "Annual",
@@ -295,7 +441,7 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Revenue",
             "metric_category": "Financial",
-            "value": 5000000.00,
+            "value": Decimal("5000000.00"),
             "unit": "USD",
             "metric_date": date(2023, 12, 31),
             "reporting_period": "Annual",
@@ -304,43 +450,56 @@ def sample_business_metrics() -> List[Dict[str, Any]]:
         {
             "metric_name": "Revenue",
             "metric_category": "Financial",
-            "value": 5500000.00,
+            "value": Decimal("5500000.00"),
             "unit": "USD",
             "metric_date": date(2024, 12, 31),
             "reporting_period": "Annual",
             "created_by": "test_system"
         }
-    ]
+    ])
 
 
 # ============================================================================
 # Helper Functions for Seeding Test Data
 # ============================================================================
 
-def seed_emission_factors(conn: Connection, factors: List[Dict[str, Any]]) -> List[int]:
+def seed_emission_factors(
+    conn: Connection,
+    factors: List[Dict[str, Any]],
+    return_ids: bool = False,
+    *,
+    cursor: Optional[Cursor] = None,
+    commit: bool = True
+) -> Optional[List[int]]:
     """
     Insert emission factors into the test database
     
     Args:
         conn: Database connection
         factors: List of emission factor dictionaries
+        return_ids: Insert with RETURNING and return the new factor_ids
+        cursor: Cursor to reuse; a new one is opened and closed if omitted
+        commit: Commit after inserting; pass False to batch several
+            seeders into one transaction and commit once
     
     Returns:
-        List of inserted factor_ids
+        List of inserted factor_ids, or None when return_ids is False
     """
-    cursor = conn.cursor()
-    factor_ids = []
+    own_cursor = cursor is None
+    if own_cursor:
+        cursor = conn.cursor()
     
     insert_query = """
         INSERT INTO emission_factors (
             activity_name, scope, activity_unit, co2e_per_unit, 
             source, valid_from, valid_to, created_by
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING factor_id
+        ) VALUES %s
     """
+    if return_ids:
+        insert_query += " RETURNING factor_id"
     
-    for factor in factors:
-        cursor.execute(insert_query, (
+    rows = execute_values(cursor, insert_query, [
+        (
             factor["activity_name"],
             factor["scope"],
             factor["activity_unit"],
@@ -349,59 +508,139 @@ def seed_emission_factors(conn: Connection, factors: List[Dict[str, Any]]) -> Li
             factor["valid_from"],
             factor["valid_to"],
             factor["created_by"]
-        ))
-        factor_id = cursor.fetchone()[0]
-        factor_ids.append(factor_id)
+        )
+        for factor in factors
+    ], page_size=500, fetch=return_ids)
+    factor_ids = [row[0] for row in rows] if return_ids else None
     
-    conn.commit()
-    cursor.close()
+    if commit:
+        conn.commit()
+    if own_cursor:
+        cursor.close()
     return factor_ids
 
 
-def seed_business_metrics(conn: Connection, metrics: List[Dict[str, Any]]) -> List[int]:
+BUSINESS_METRIC_COLUMNS = (
+    "metric_name", "metric_category", "value", "unit",
+    "metric_date", "reporting_period", "created_by"
+)
+
+# Array type each column is sent as, in BUSINESS_METRIC_COLUMNS order
+BUSINESS_METRIC_ARRAY_TYPES = (
+    "text[]", "text[]", "numeric[]", "text[]", "date[]", "text[]", "text[]"
+)
+
+
+def seed_business_metrics(
+    conn: Connection,
+    metrics: List[Dict[str, Any]],
+    use_copy: bool = False,
+    return_ids: bool = False,
+    *,
+    cursor: Optional[Cursor] = None,
+    commit: bool = True
+) -> Optional[List[int]]:
     """
     Insert business metrics into the test database
     
     Args:
         conn: Database connection
         metrics: List of business metric dictionaries
+        use_copy: Load the rows with COPY instead of an UNNEST INSERT,
+            for large synthetic datasets
+        return_ids: Return the new metric_ids in input order
+        cursor: Cursor to reuse; a new one is opened and closed if omitted
+        commit: Commit after inserting; pass False to batch several
+            seeders into one transaction and commit once
     
     Returns:
-        List of inserted metric_ids
+        List of inserted metric_ids, or None when return_ids is False
     """
-    cursor = conn.cursor()
-    metric_ids = []
+    own_cursor = cursor is None
+    if own_cursor:
+        cursor = conn.cursor()
     
-    insert_query = """
-        INSERT INTO business_metrics (
-            metric_name, metric_category, value, unit, 
-            metric_date, reporting_period, created_by
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-        RETURNING metric_id
-    """
-    
-    for metric in metrics:
-        cursor.execute(insert_query, (
-            metric["metric_name"],
-            metric["metric_category"],
-            metric["value"],
-            metric["unit"],
-            metric["metric_date"],
-            metric["reporting_period"],
-            metric["created_by"]
-        ))
-        metric_id = cursor.fetchone()[0]
-        metric_ids.append(metric_id)
+    if use_copy:
+        rows = [
+            tuple(metric[column] for column in BUSINESS_METRIC_COLUMNS)
+            for metric in metrics
+        ]
+        metric_ids = _copy_business_metrics(cursor, rows, return_ids)
+    else:
+        # One array per column, expanded server-side by UNNEST, so the
+        # statement stays the same size however many metrics are inserted
+        arrays = [
+            [metric[column] for metric in metrics]
+            for column in BUSINESS_METRIC_COLUMNS
+        ]
+        placeholders = ", ".join(
+            f"%s::{array_type}" for array_type in BUSINESS_METRIC_ARRAY_TYPES
+        )
+        insert_query = f"""
+            INSERT INTO business_metrics ({", ".join(BUSINESS_METRIC_COLUMNS)})
+            SELECT * FROM UNNEST({placeholders})
+        """
+        if return_ids:
+            insert_query += " RETURNING metric_id"
+        cursor.execute(insert_query, arrays)
+        metric_ids = [row[0] for row in cursor.fetchall()] if return_ids else None
     
-    conn.commit()
-    cursor.close()
+    if commit:
+        conn.commit()
+    if own_cursor:
+        cursor.close()
     return metric_ids
 
 
+def _copy_business_metrics(
+    cursor,
+    rows: List[tuple],
+    return_ids: bool
+) -> Optional[List[int]]:
+    """
+    COPY business metric rows, optionally returning their ids in input order
+    
+    COPY has no RETURNING, so the new ids are read back as the ones above
+    the previous maximum; the test connection is the only writer.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter="\t", lineterminator="\n").writerows(rows)
+    buffer.seek(0)
+    
+    if return_ids:
+        cursor.execute("SELECT COALESCE(MAX(metric_id), 0) FROM business_metrics")
+        last_id = cursor.fetchone()[0]
+    
+    cursor.copy_expert(
+        f"COPY business_metrics ({', '.join(BUSINESS_METRIC_COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')",
+        buffer
+    )
+    
+    if not return_ids:
+        return None
+    cursor.execute(
+        "SELECT metric_id FROM business_metrics WHERE metric_id > %s ORDER BY metric_id",
+        (last_id,)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+EMISSION_RECORD_COLUMNS = (
+    "activity_date", "activity_name", "scope", "activity_value",
+    "activity_unit", "factor_id", "calculated_co2e", "created_by",
+    "location", "department"
+)
+
+
 def seed_emission_records(
     conn: Connection, 
-    records: List[Dict[str, Any]]
-) -> List[int]:
+    records: List[Dict[str, Any]],
+    return_ids: bool = False,
+    *,
+    cursor: Optional[Cursor] = None,
+    commit: bool = True
+) -> Optional[List[int]]:
     """
     Insert emission records into the test database
     
@@ -411,24 +650,17 @@ def seed_emission_records(
             Each record should contain:
             - activity_date, activity_name, scope, activity_value, 
             - activity_unit, factor_id, calculated_co2e, created_by
+        return_ids: Insert with RETURNING and return the new record_ids;
+            otherwise the rows are bulk loaded with COPY
+        cursor: Cursor to reuse; a new one is opened and closed if omitted
+        commit: Commit after inserting; pass False to batch several
+            seeders into one transaction and commit once
     
     Returns:
-        List of inserted record_ids
-    """
-    cursor = conn.cursor()
-    record_ids = []
-    
-    insert_query = """
-        INSERT INTO emission_records (
-            activity_date, activity_name, scope, activity_value,
-            activity_unit, factor_id, calculated_co2e, created_by,
-            location, department
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING record_id
+        List of inserted record_ids, or None when return_ids is False
     """
-    
-    for record in records:
-        cursor.execute(insert_query, (
+    rows = [
+        (
             record["activity_date"],
             record["activity_name"],
             record["scope"],
@@ -439,15 +671,150 @@ def seed_emission_records(
             record.get("created_by", "test_system"),
             record.get("location"),
             record.get("department")
-        ))
-        record_id = cursor.fetchone()[0]
-        record_ids.append(record_id)
+        )
+        for record in records
+    ]
+    return seed_emission_record_rows(
+        conn, rows, return_ids, cursor=cursor, commit=commit
+    )
+
+
+def seed_emission_record_rows(
+    conn: Connection,
+    rows: List[tuple],
+    return_ids: bool = False,
+    *,
+    cursor: Optional[Cursor] = None,
+    commit: bool = True
+) -> Optional[List[int]]:
+    """
+    Insert emission records given as tuples in EMISSION_RECORD_COLUMNS order
+    Same as seed_emission_records without the per-record dict handling
+    """
+    own_cursor = cursor is None
+    if own_cursor:
+        cursor = conn.cursor()
+    
+    record_ids = _insert_emission_record_rows(cursor, rows, return_ids)
+    
+    if commit:
+        conn.commit()
+    if own_cursor:
+        cursor.close()
+    return record_ids
+
+
+def _insert_emission_record_rows(
+    cursor: Cursor,
+    rows: List[tuple],
+    return_ids: bool
+) -> Optional[List[int]]:
+    """
+    Insert emission record rows with RETURNING, or COPY them when no ids
+    are needed
+    """
+    record_ids = None
+    
+    if return_ids:
+        insert_query = f"""
+            INSERT INTO emission_records ({", ".join(EMISSION_RECORD_COLUMNS)})
+            VALUES %s
+            RETURNING record_id
+        """
+        result = execute_values(cursor, insert_query, rows, page_size=500, fetch=True)
+        record_ids = [row[0] for row in result]
+    else:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(
+            tuple("\\N" if value is None else value for value in row)
+            for row in rows
+        )
+        buffer.seek(0)
+        cursor.copy_expert(
+            f"COPY emission_records ({', '.join(EMISSION_RECORD_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
     
-    conn.commit()
-    cursor.close()
     return record_ids
 
 
+FACTOR_LOOKUP_QUERY = """
+    SELECT factor_id, activity_unit
+    FROM emission_factors
+    WHERE activity_name = %(activity_name)s
+      AND scope = %(scope)s
+      AND valid_from <= %(activity_date)s
+      AND (valid_to >= %(activity_date)s OR valid_to IS NULL)
+    ORDER BY valid_from DESC, created_at DESC
+    LIMIT 1
+"""
+
+# Connections that have the ghg_factor_lookup statement prepared
+_prepared_factor_lookups = weakref.WeakSet()
+
+
+@contextmanager
+def prepared_factor_lookup(conn: Connection) -> Generator[Connection, None, None]:
+    """
+    Prepare the factor lookup once for repeated use on this connection
+    
+    While active, get_valid_factor_id and create_emission_record_with_factor
+    run EXECUTE ghg_factor_lookup instead of parsing and planning the
+    SELECT on every call.
+    """
+    prepare_query = FACTOR_LOOKUP_QUERY % {
+        "activity_name": "$1", "scope": "$2", "activity_date": "$3"
+    }
+    prepared_here = conn not in _prepared_factor_lookups
+    if prepared_here:
+        with conn.cursor() as cursor:
+            cursor.execute(f"PREPARE ghg_factor_lookup (text, int, date) AS {prepare_query}")
+        _prepared_factor_lookups.add(conn)
+    try:
+        yield conn
+    finally:
+        # DEALLOCATE is refused inside an aborted transaction. PREPARE is not
+        # transactional, so the statement then outlives the rollback; the
+        # connection stays registered and the next caller reuses it
+        if prepared_here and conn.info.transaction_status != TRANSACTION_STATUS_INERROR:
+            with conn.cursor() as cursor:
+                cursor.execute("DEALLOCATE ghg_factor_lookup")
+            _prepared_factor_lookups.discard(conn)
+
+
+def lookup_factor(
+    cursor: Cursor,
+    activity_name: str,
+    scope: int,
+    activity_date: date
+) -> Optional[Tuple[int, str]]:
+    """
+    Fetch (factor_id, activity_unit) of the factor valid on a date
+    Uses the prepared statement when prepared_factor_lookup is active
+    """
+    if cursor.connection in _prepared_factor_lookups:
+        cursor.execute(
+            "EXECUTE ghg_factor_lookup (%s, %s, %s)",
+            (activity_name, scope, activity_date)
+        )
+    else:
+        cursor.execute(FACTOR_LOOKUP_QUERY, {
+            "activity_name": activity_name,
+            "scope": scope,
+            "activity_date": activity_date
+        })
+    return cursor.fetchone()
+
+
+def _factor_not_found(activity_name: str, scope: int, activity_date: date) -> ValueError:
+    """Error raised by every factor lookup that finds no valid factor"""
+    return ValueError(
+        f"No valid emission factor found for {activity_name} "
+        f"(scope {scope}) on {activity_date}"
+    )
+
+
 def get_valid_factor_id(
     conn: Connection,
     activity_name: str,
@@ -471,29 +838,126 @@ def get_valid_factor_id(
         ValueError: If no valid factor is found
     """
     cursor = conn.cursor()
+    result = lookup_factor(cursor, activity_name, scope, activity_date)
+    cursor.close()
     
-    query = """
-        SELECT factor_id, co2e_per_unit, activity_unit
-        FROM emission_factors
-        WHERE activity_name = %s
-          AND scope = %s
-          AND valid_from <= %s
-          AND (valid_to >= %s OR valid_to IS NULL)
-        ORDER BY valid_from DESC, created_at DESC
-        LIMIT 1
+    if result is None:
+        raise _factor_not_found(activity_name, scope, activity_date)
+    
+    return result[0]
+
+
+FactorCacheEntry = Tuple[date, Optional[date], int, Decimal, str]
+
+
+def build_factor_cache(conn: Connection) -> Dict[Tuple[str, int], List[FactorCacheEntry]]:
     """
+    Load every emission factor once for in-process lookups
+    
+    Args:
+        conn: Database connection
+    
+    Returns:
+        Dictionary keyed by (activity_name, scope); each value lists
+        (valid_from, valid_to, factor_id, co2e_per_unit, activity_unit)
+        in the lookup's preference order, newest valid_from first
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT activity_name, scope, valid_from, valid_to,
+               factor_id, co2e_per_unit, activity_unit
+        FROM emission_factors
+        ORDER BY activity_name, scope, valid_from DESC, created_at DESC
+    """)
+    
+    cache: Dict[Tuple[str, int], List[FactorCacheEntry]] = {}
+    for activity_name, scope, *entry in cursor.fetchall():
+        cache.setdefault((activity_name, scope), []).append(tuple(entry))
     
-    cursor.execute(query, (activity_name, scope, activity_date, activity_date))
-    result = cursor.fetchone()
     cursor.close()
+    return cache
+
+
+def resolve_cached_factor(
+    cache: Dict[Tuple[str, int], List[FactorCacheEntry]],
+    activity_name: str,
+    scope: int,
+    activity_date: date
+) -> FactorCacheEntry:
+    """
+    Pick the factor valid on activity_date from a build_factor_cache() result
+    Same selection as get_valid_factor_id, without a database round-trip
     
-    if result is None:
+    Entries are newest first, so a bisect skips every version that starts
+    after activity_date; the first remaining one still open on that date wins.
+    
+    Raises:
+        ValueError: If no valid factor is found
+    """
+    entries = cache.get((activity_name, scope), [])
+    start = bisect.bisect_left(
+        entries, -activity_date.toordinal(), key=lambda entry: -entry[0].toordinal()
+    )
+    for entry in entries[start:]:
+        valid_to = entry[1]
+        if valid_to is None or valid_to >= activity_date:
+            return entry
+    
+    raise _factor_not_found(activity_name, scope, activity_date)
+
+
+def _resolve_factor_for(
+    conn: Connection,
+    activity_name: str,
+    scope: int,
+    activity_date: date,
+    activity_unit: str,
+    factor_index: Optional[Dict[Tuple[str, int], List[FactorCacheEntry]]] = None
+) -> int:
+    """
+    Resolve the factor_id for an activity and check its unit
+    Uses factor_index when given, otherwise queries for the factor
+    
+    Raises:
+        ValueError: If no valid factor is found or its unit does not match
+    """
+    if factor_index is not None:
+        _, _, factor_id, _, factor_unit = resolve_cached_factor(
+            factor_index, activity_name, scope, activity_date
+        )
+    else:
+        cursor = conn.cursor()
+        result = lookup_factor(cursor, activity_name, scope, activity_date)
+        cursor.close()
+        if result is None:
+            raise _factor_not_found(activity_name, scope, activity_date)
+        factor_id, factor_unit = result
+    
+    if activity_unit != factor_unit:
         raise ValueError(
-            f"No valid emission factor found for {activity_name} "
-            f"(scope {scope}) on {activity_date}"
+            f"Unit mismatch: activity uses '{activity_unit}' "
+            f"but factor uses '{factor_unit}'"
         )
     
-    return result[0]
+    return factor_id
+
+
+class CreatedEmissionRecord(NamedTuple):
+    """Row returned by create_emission_record_with_factor"""
+    record_id: int
+    factor_id: int
+    activity_value: Decimal
+    calculated_co2e: Decimal
+    co2e_per_unit: Decimal
+
+
+# Reads back a CreatedEmissionRecord from an emission_records INSERT
+CREATED_RECORD_RETURNING = """
+    RETURNING record_id, factor_id, activity_value, calculated_co2e, (
+        SELECT co2e_per_unit FROM emission_factors ef
+        WHERE ef.factor_id = emission_records.factor_id
+    )
+"""
 
 
 def create_emission_record_with_factor(
@@ -504,8 +968,9 @@ def create_emission_record_with_factor(
     activity_value: float,
     activity_unit: str,
     location: str = None,
-    department: str = None
-) -> int:
+    department: str = None,
+    factor_index: Optional[Dict[Tuple[str, int], List[FactorCacheEntry]]] = None
+) -> CreatedEmissionRecord:
     """
     Create an emission record with automatic factor lookup
     This simulates the real emission calculation flow
@@ -519,57 +984,28 @@ def create_emission_record_with_factor(
         activity_unit: Unit of measurement
         location: Optional location
         department: Optional department
+        factor_index: build_factor_cache() result to resolve the factor
+            from instead of querying for it
     
     Returns:
-        record_id of the created emission record
+        CreatedEmissionRecord with the stored values and the factor's
+        co2e_per_unit, all read back by the INSERT itself
     """
-    cursor = conn.cursor()
-    
-    # Get the valid factor for this date
-    factor_query = """
-        SELECT factor_id, co2e_per_unit, activity_unit
-        FROM emission_factors
-        WHERE activity_name = %s
-          AND scope = %s
-          AND valid_from <= %s
-          AND (valid_to >= %s OR valid_to IS NULL)
-        ORDER BY valid_from DESC, created_at DESC
-        LIMIT 1
-    """
-    
-    cursor.execute(factor_query, (activity_name, scope, activity_date, activity_date))
-    factor_result = cursor.fetchone()
-    
-    if factor_result is None:
-        cursor.close()
-        raise ValueError(
-            f"No valid emission factor found for {activity_name} "
-            f"(scope {scope}) on {activity_date}"
-        )
-    
-    factor_id, co2e_per_unit, factor_unit = factor_result
-    
-    # Verify units match
-    if activity_unit != factor_unit:
-        cursor.close()
-        raise ValueError(
-            f"Unit mismatch: activity uses '{activity_unit}' "
-            f"but factor uses '{factor_unit}'"
-        )
-    
-    # Calculate emissions
-    calculated_co2e = activity_value * co2e_per_unit
+    factor_id = _resolve_factor_for(
+        conn, activity_name, scope, activity_date, activity_unit, factor_index
+    )
     
-    # Insert the emission record
+    # Insert the emission record; calculated_co2e is filled in by the
+    # trg_calc_co2e trigger from the factor's co2e_per_unit
     insert_query = """
         INSERT INTO emission_records (
             activity_date, activity_name, scope, activity_value,
-            activity_unit, factor_id, calculated_co2e, created_by,
+            activity_unit, factor_id, created_by,
             location, department
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING record_id
-    """
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """ + CREATED_RECORD_RETURNING
     
+    cursor = conn.cursor()
     cursor.execute(insert_query, (
         activity_date,
         activity_name,
@@ -577,34 +1013,137 @@ def create_emission_record_with_factor(
         activity_value,
         activity_unit,
         factor_id,
-        calculated_co2e,
         "test_system",
         location,
         department
     ))
     
-    record_id = cursor.fetchone()[0]
+    record = CreatedEmissionRecord(*cursor.fetchone())
     conn.commit()
     cursor.close()
     
-    return record_id
+    return record
+
+
+def create_emission_records_with_factor(
+    conn: Connection,
+    records: List[Tuple[date, str, int, Any, str, Optional[str], Optional[str]]],
+    factor_index: Optional[Dict[Tuple[str, int], List[FactorCacheEntry]]] = None
+) -> List[CreatedEmissionRecord]:
+    """
+    Create several emission records with automatic factor lookup in one INSERT
+    Batch form of create_emission_record_with_factor
+    
+    Args:
+        conn: Database connection
+        records: (activity_date, activity_name, scope, activity_value,
+            activity_unit, location, department) tuples
+        factor_index: build_factor_cache() result; read from the database
+            if omitted
+    
+    Returns:
+        CreatedEmissionRecord for each record, in input order
+    
+    Raises:
+        ValueError: If a factor is missing or its unit does not match
+    """
+    if factor_index is None:
+        factor_index = build_factor_cache(conn)
+    
+    rows = []
+    for (activity_date, activity_name, scope, activity_value,
+         activity_unit, location, department) in records:
+        factor_id = _resolve_factor_for(
+            conn, activity_name, scope, activity_date, activity_unit, factor_index
+        )
+        rows.append((
+            activity_date, activity_name, scope, activity_value, activity_unit,
+            factor_id, "test_system", location, department
+        ))
+    
+    # calculated_co2e is filled in by the trg_calc_co2e trigger
+    insert_query = """
+        INSERT INTO emission_records (
+            activity_date, activity_name, scope, activity_value,
+            activity_unit, factor_id, created_by,
+            location, department
+        ) VALUES %s
+    """ + CREATED_RECORD_RETURNING
+    
+    cursor = conn.cursor()
+    result = execute_values(cursor, insert_query, rows, page_size=500, fetch=True)
+    conn.commit()
+    cursor.close()
+    
+    return [CreatedEmissionRecord(*row) for row in result]
 
 
 # ============================================================================
 # Composite Fixtures - Pre-seeded Database States
 # ============================================================================
 
+@contextmanager
+def seed_savepoint(conn: Connection, name: str) -> Generator[Connection, None, None]:
+    """
+    Keep data seeded inside the block until the block exits
+    
+    Used by class-scoped fixtures: the data is seeded once under the named
+    savepoint, each test's own savepoint nests inside it, and rolling back
+    to it when the class is done removes the data again.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(f"SAVEPOINT {name}")
+    try:
+        yield conn
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {name}; RELEASE SAVEPOINT {name}")
+
+
+@pytest.fixture(scope="class")
+def seeded_factors(session_connection: Connection, sample_emission_factors):
+    """
+    Emission factors seeded once per test class, with the lookup prepared
+    The seed stays visible to every later test in the class, so keep tests
+    that seed factors themselves out of classes that use db_with_factors
+    """
+    with seed_savepoint(session_connection, "seeded_factors") as conn:
+        seed_emission_factors(conn, sample_emission_factors, commit=False)
+        with prepared_factor_lookup(conn):
+            yield conn
+
+
+@pytest.fixture(scope="class")
+def factor_index(seeded_factors: Connection) -> Dict[Tuple[str, int], List[FactorCacheEntry]]:
+    """
+    build_factor_cache() of the seeded factors, read once per test class
+    Pass to create_emission_record_with_factor to skip its factor query
+    """
+    return build_factor_cache(seeded_factors)
+
+
 @pytest.fixture
-def db_with_factors(db_connection: Connection, clean_database, sample_emission_factors):
+def db_with_factors(seeded_factors: Connection, db_connection: Connection):
     """
     Database with emission factors seeded
+    The factors are shared by the test class; anything a test writes is
+    rolled back with its savepoint
     """
-    seed_emission_factors(db_connection, sample_emission_factors)
     return db_connection
 
 
 @pytest.fixture
-def db_with_metrics(db_connection: Connection, clean_database, sample_business_metrics):
+def cur(db_with_factors: Connection) -> Generator[Cursor, None, None]:
+    """
+    Cursor on db_with_factors, closed after the test
+    """
+    cursor = db_with_factors.cursor()
+    yield cursor
+    cursor.close()
+
+
+@pytest.fixture
+def db_with_metrics(db_connection: Connection, sample_business_metrics):
     """
     Database with business metrics seeded
     """
@@ -615,142 +1154,104 @@ def db_with_metrics(db_connection: Connection, clean_database, sample_business_m
 @pytest.fixture
 def db_with_factors_and_metrics(
     db_connection: Connection, 
-    clean_database, 
     sample_emission_factors,
     sample_business_metrics
 ):
     """
     Database with both emission factors and business metrics seeded
     """
-    seed_emission_factors(db_connection, sample_emission_factors)
-    seed_business_metrics(db_connection, sample_business_metrics)
+    with db_connection.cursor() as cursor:
+        seed_emission_factors(db_connection, sample_emission_factors, cursor=cursor, commit=False)
+        seed_business_metrics(db_connection, sample_business_metrics, cursor=cursor, commit=False)
+    db_connection.commit()
     return db_connection
 
 
+# Emission records for db_with_full_test_data, spanning 2023-2024 with historical
+# factor changes, as (activity_date, activity_name, scope, activity_value,
+# activity_unit, location, department) tuples in create_emission_record_with_factor's
+# positional order
+FULL_TEST_DATA_RECORDS: List[Tuple[date, str, int, Decimal, str, str, str]] = [
+    # 2023 records use the 2023 factor versions
+    # Diesel usage in 2023 (should use factor with co2e_per_unit=2.71)
+    (date(2023, 1, 15), "Diesel", 1, Decimal("1000.0"), "litres", "Plant A", "Operations"),
+    (date(2023, 6, 15), "Diesel", 1, Decimal("1500.0"), "litres", "Plant A", "Operations"),
+    # Grid Electricity in 2023 (should use factor with co2e_per_unit=0.45)
+    (date(2023, 1, 31), "Grid Electricity", 2, Decimal("50000.0"), "kWh", "Plant A", "Operations"),
+    (date(2023, 2, 28), "Grid Electricity", 2, Decimal("52000.0"), "kWh", "Plant A", "Operations"),
+    # Natural Gas in 2023
+    (date(2023, 3, 15), "Natural Gas", 1, Decimal("2000.0"), "m3", "Plant B", "Production"),
+    
+    # 2024 records use the 2024 factor versions
+    # Diesel usage in 2024 (should use factor with co2e_per_unit=2.73)
+    (date(2024, 1, 15), "Diesel", 1, Decimal("1000.0"), "litres", "Plant A", "Operations"),
+    (date(2024, 6, 15), "Diesel", 1, Decimal("1200.0"), "litres", "Plant A", "Operations"),
+    # Grid Electricity in 2024 (should use factor with co2e_per_unit=0.42)
+    (date(2024, 1, 31), "Grid Electricity", 2, Decimal("55000.0"), "kWh", "Plant A", "Operations"),
+    (date(2024, 2, 29), "Grid Electricity", 2, Decimal("58000.0"), "kWh", "Plant A", "Operations"),
+    # Natural Gas in 2024
+    (date(2024, 3, 15), "Natural Gas", 1, Decimal("2500.0"), "m3", "Plant B", "Production"),
+    # Air Travel in 2024 (Scope 3)
+    (date(2024, 4, 10), "Air Travel", 3, Decimal("5000.0"), "km", "Corporate", "Sales")
+]
+
+
+@pytest.fixture(scope="class")
+def seeded_full_test_data(
+    session_connection: Connection,
+    sample_emission_factors,
+    sample_business_metrics
+):
+    """
+    Factors, metrics, and sample emission records seeded once per test class
+    Creates a realistic dataset spanning 2023-2024 with historical factor changes
+    All seeding shares one cursor
+    """
+    with seed_savepoint(session_connection, "seeded_full_test_data") as conn:
+        _seed_full_test_data(conn, sample_emission_factors, sample_business_metrics)
+        yield conn
+
+
 @pytest.fixture
-def db_with_full_test_data(db_with_factors_and_metrics: Connection):
+def db_with_full_test_data(seeded_full_test_data: Connection, db_connection: Connection):
     """
     Database with factors, metrics, and sample emission records
-    Creates a realistic dataset spanning 2023-2024 with historical factor changes
+    The data is shared by the test class; anything a test writes is
+    rolled back with its savepoint
     """
-    conn = db_with_factors_and_metrics
-    
-    # Create emission records for 2023 using 2023 factors
-    records_2023 = [
-        # Diesel usage in 2023 (should use factor with co2e_per_unit=2.71)
-        {
-            "activity_date": date(2023, 1, 15),
-            "activity_name": "Diesel",
-            "scope": 1,
-            "activity_value": 1000.0,
-            "activity_unit": "litres",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        {
-            "activity_date": date(2023, 6, 15),
-            "activity_name": "Diesel",
-            "scope": 1,
-            "activity_value": 1500.0,
-            "activity_unit": "litres",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        # Grid Electricity in 2023 (should use factor with co2e_per_unit=0.45)
-        {
-            "activity_date": date(2023, 1, 31),
-            "activity_name": "Grid Electricity",
-            "scope": 2,
-            "activity_value": 50000.0,
-            "activity_unit": "kWh",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        {
-            "activity_date": date(2023, 2, 28),
-            "activity_name": "Grid Electricity",
-            "scope": 2,
-            "activity_value": 52000.0,
-            "activity_unit": "kWh",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        # Natural Gas in 2023
-        {
-            "activity_date": date(2023, 3, 15),
-            "activity_name": "Natural Gas",
-            "scope": 1,
-            "activity_value": 2000.0,
-            "activity_unit": "m3",
-            "location": "Plant B",
-            "department": "Production"
-        }
-    ]
+    return db_connection
+
+
+def _seed_full_test_data(
+    conn: Connection,
+    sample_emission_factors: List[Dict[str, Any]],
+    sample_business_metrics: List[Dict[str, Any]]
+) -> None:
+    """
+    Seed the db_with_full_test_data dataset without committing
+    """
+    cursor = conn.cursor()
+    seed_emission_factors(conn, sample_emission_factors, cursor=cursor, commit=False)
+    seed_business_metrics(
+        conn, sample_business_metrics, use_copy=True, cursor=cursor, commit=False
+    )
     
-    # Create emission records for 2024 using 2024 factors
-    records_2024 = [
-        # Diesel usage in 2024 (should use factor with co2e_per_unit=2.73)
-        {
-            "activity_date": date(2024, 1, 15),
-            "activity_name": "Diesel",
-            "scope": 1,
-            "activity_value": 1000.0,
-            "activity_unit": "litres",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        {
-            "activity_date": date(2024, 6, 15),
-            "activity_name": "Diesel",
-            "scope": 1,
-            "activity_value": 1200.0,
-            "activity_unit": "litres",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        # Grid Electricity in 2024 (should use factor with co2e_per_unit=0.42)
-        {
-            "activity_date": date(2024, 1, 31),
-            "activity_name": "Grid Electricity",
-            "scope": 2,
-            "activity_value": 55000.0,
-            "activity_unit": "kWh",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        {
-            "activity_date": date(2024, 2, 29),
-            "activity_name": "Grid Electricity",
-            "scope": 2,
-            "activity_value": 58000.0,
-            "activity_unit": "kWh",
-            "location": "Plant A",
-            "department": "Operations"
-        },
-        # Natural Gas in 2024
-        {
-            "activity_date": date(2024, 3, 15),
-            "activity_name": "Natural Gas",
-            "scope": 1,
-            "activity_value": 2500.0,
-            "activity_unit": "m3",
-            "location": "Plant B",
-            "department": "Production"
-        },
-        # Air Travel in 2024 (Scope 3)
-        {
-            "activity_date": date(2024, 4, 10),
-            "activity_name": "Air Travel",
-            "scope": 3,
-            "activity_value": 5000.0,
-            "activity_unit": "km",
-            "location": "Corporate",
-            "department": "Sales"
-        }
-    ]
+    # Resolve factors in-process from one cached read, then bulk insert
+    factor_cache = build_factor_cache(conn)
+    records = []
     
-    # Insert all records using the helper function
-    for record in records_2023 + records_2024:
-        create_emission_record_with_factor(conn, **record)
+    for (activity_date, activity_name, scope, activity_value,
+         activity_unit, location, department) in FULL_TEST_DATA_RECORDS:
+        factor_id = _resolve_factor_for(
+            conn, activity_name, scope, activity_date, activity_unit, factor_cache
+        )
+        # Row in EMISSION_RECORD_COLUMNS order; a NULL calculated_co2e is
+        # filled in by trg_calc_co2e (COPY fires row triggers too)
+        records.append((
+            activity_date, activity_name, scope, activity_value, activity_unit,
+            factor_id, None,
+            "test_system", location, department
+        ))
     
-    return conn
+    seed_emission_record_rows(conn, records, cursor=cursor, commit=False)
+    cursor.close()
@@ -2,8 +2,11 @@
 Test Database Setup Script
 Creates and initializes the test database with schema
 """
+import hashlib
 import os
 import sys
+from functools import lru_cache
+
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
@@ -29,9 +32,85 @@ ADMIN_DB_CONFIG = {
 }
 
 
+# Template database holding the initialized schema; the test database is
+# cloned from it instead of replaying init.sql on every setup
+TEMPLATE_DB_NAME = os.getenv(
+    "TEST_DB_TEMPLATE_NAME",
+    f"{TEST_DB_CONFIG['database']}_template"
+)
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'init.sql')
+
+
+@lru_cache(maxsize=1)
+def read_schema_sql():
+    """
+    Read init.sql
+    Cached, so repeated schema setups in one process read the file once
+    """
+    if not os.path.exists(SCHEMA_FILE):
+        raise FileNotFoundError(f"Schema file not found: {SCHEMA_FILE}")
+    
+    with open(SCHEMA_FILE, 'r') as f:
+        return f.read()
+
+
+def terminate_connections(cursor, database):
+    """
+    Disconnect other sessions so the database can be dropped or cloned
+    """
+    cursor.execute("""
+        SELECT pg_terminate_backend(pid)
+        FROM pg_stat_activity
+        WHERE datname = %s AND pid <> pg_backend_pid()
+    """, (database,))
+
+
+def build_template_db():
+    """
+    Create the template database from init.sql, unless it is already up to date
+    
+    The template is tagged with a hash of init.sql (as its database comment),
+    so it is only rebuilt when the schema file changes.
+    """
+    schema_sql = read_schema_sql()
+    schema_hash = f"init.sql sha256 {hashlib.sha256(schema_sql.encode()).hexdigest()}"
+    
+    conn = psycopg2.connect(**ADMIN_DB_CONFIG)
+    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute(
+            "SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = %s",
+            (TEMPLATE_DB_NAME,)
+        )
+        existing = cursor.fetchone()
+        
+        if existing and existing[0] == schema_hash:
+            print(f"Template database '{TEMPLATE_DB_NAME}' is up to date")
+            return
+        
+        if existing:
+            print(f"Schema changed, rebuilding template database '{TEMPLATE_DB_NAME}'...")
+            terminate_connections(cursor, TEMPLATE_DB_NAME)
+            cursor.execute(f"DROP DATABASE {TEMPLATE_DB_NAME}")
+        else:
+            print(f"Creating template database: {TEMPLATE_DB_NAME}")
+        
+        cursor.execute(f"CREATE DATABASE {TEMPLATE_DB_NAME}")
+        initialize_test_schema({**TEST_DB_CONFIG, "database": TEMPLATE_DB_NAME}, schema_sql)
+        # Tag only after the schema loaded, so a failed build is redone next time
+        cursor.execute(f"COMMENT ON DATABASE {TEMPLATE_DB_NAME} IS %s", (schema_hash,))
+    finally:
+        cursor.close()
+        conn.close()
+
+
 def create_test_database():
     """
-    Create the test database if it doesn't exist
+    Create the test database as a copy of the template database
+    Any existing test database is dropped first for a clean state
     """
     print(f"Creating test database: {TEST_DB_CONFIG['database']}")
     
@@ -51,44 +130,53 @@ def create_test_database():
         print(f"Test database '{TEST_DB_CONFIG['database']}' already exists")
         # Drop and recreate for clean state
         print("Dropping existing test database...")
+        terminate_connections(cursor, TEST_DB_CONFIG["database"])
         cursor.execute(f"DROP DATABASE {TEST_DB_CONFIG['database']}")
     
-    # Create the test database
-    cursor.execute(f"CREATE DATABASE {TEST_DB_CONFIG['database']}")
+    # Clone the test database from the template (a file copy, no DDL replay)
+    terminate_connections(cursor, TEMPLATE_DB_NAME)
+    cursor.execute(
+        f"CREATE DATABASE {TEST_DB_CONFIG['database']} TEMPLATE {TEMPLATE_DB_NAME}"
+    )
     print(f"Test database '{TEST_DB_CONFIG['database']}' created successfully")
     
     cursor.close()
     conn.close()
 
 
-def initialize_test_schema():
-    """
-    Initialize the test database schema using init.sql
+# Transaction-scoped settings applied before running init.sql: skip WAL
+# flushes, give index builds enough memory to sort in RAM and drop NOTICEs
+SCHEMA_LOAD_SETTINGS = """
+    SET LOCAL synchronous_commit = off;
+    SET LOCAL maintenance_work_mem = '256MB';
+    SET LOCAL work_mem = '64MB';
+    SET LOCAL client_min_messages = warning;
+"""
+
+
+def initialize_test_schema(db_config=None, schema_sql=None):
     """
-    print("Initializing test database schema...")
+    Initialize a database schema using init.sql
     
-    # Read the schema SQL file
-    schema_file = os.path.join(
-        os.path.dirname(__file__), 
-        '..', 
-        '..', 
-        'init.sql'
-    )
-    
-    if not os.path.exists(schema_file):
-        raise FileNotFoundError(f"Schema file not found: {schema_file}")
+    Args:
+        db_config: Connection settings, defaults to the test database
+        schema_sql: Schema script, read from init.sql if not given
+    """
+    db_config = db_config or TEST_DB_CONFIG
+    print(f"Initializing schema in '{db_config['database']}'...")
     
-    with open(schema_file, 'r') as f:
-        schema_sql = f.read()
+    if schema_sql is None:
+        schema_sql = read_schema_sql()
     
-    # Connect to test database and execute schema
-    conn = psycopg2.connect(**TEST_DB_CONFIG)
+    # Connect to the database and execute schema
+    conn = psycopg2.connect(**db_config)
     cursor = conn.cursor()
     
     try:
-        cursor.execute(schema_sql)
+        # Runs as one transaction, so the SET LOCALs cover the whole script
+        cursor.execute(SCHEMA_LOAD_SETTINGS + schema_sql)
         conn.commit()
-        print("Test database schema initialized successfully")
+        print("Database schema initialized successfully")
     except Exception as e:
         conn.rollback()
         print(f"Error initializing schema: {e}")
@@ -98,15 +186,65 @@ def initialize_test_schema():
         conn.close()
 
 
+# Catalog query run by verify_test_database: one row per public table,
+# view and function, tagged with its kind, plus one 'missing' row for each
+# required table that does not exist (the diff is done server-side)
+CATALOG_QUERY = """
+    SELECT 'table' AS kind, table_name AS name
+    FROM information_schema.tables 
+    WHERE table_schema = 'public' 
+    AND table_type = 'BASE TABLE'
+    UNION ALL
+    SELECT 'view', table_name 
+    FROM information_schema.views 
+    WHERE table_schema = 'public'
+    UNION ALL
+    SELECT 'function', routine_name 
+    FROM information_schema.routines 
+    WHERE routine_schema = 'public' 
+    AND routine_type = 'FUNCTION'
+    UNION ALL
+    SELECT 'missing', required.table_name
+    FROM unnest(%s::text[]) AS required(table_name)
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM information_schema.tables
+        WHERE table_schema = 'public'
+        AND table_type = 'BASE TABLE'
+        AND table_name = required.table_name
+    )
+"""
+
+
+def fetch_catalog(required_tables):
+    """
+    Fetch the public tables, views and functions in one round trip
+    
+    Args:
+        required_tables: Table names to report under 'missing' if absent
+    
+    Returns:
+        Dictionary mapping 'table', 'view', 'function' and 'missing' to
+        lists of names
+    """
+    catalog = {"table": [], "view": [], "function": [], "missing": []}
+    conn = psycopg2.connect(**TEST_DB_CONFIG)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(CATALOG_QUERY, (required_tables,))
+        for kind, name in cursor.fetchall():
+            catalog[kind].append(name)
+    finally:
+        conn.close()
+    return catalog
+
+
 def verify_test_database():
     """
     Verify that the test database is set up correctly
     """
     print("Verifying test database setup...")
     
-    conn = psycopg2.connect(**TEST_DB_CONFIG)
-    cursor = conn.cursor()
-    
     # Check that all required tables exist
     required_tables = [
         'emission_factors',
@@ -117,49 +255,24 @@ def verify_test_database():
         'reporting_periods'
     ]
     
-    cursor.execute("""
-        SELECT table_name 
-        FROM information_schema.tables 
-        WHERE table_schema = 'public' 
-        AND table_type = 'BASE TABLE'
-    """)
-    
-    existing_tables = [row[0] for row in cursor.fetchall()]
-    
-    missing_tables = set(required_tables) - set(existing_tables)
+    catalog = fetch_catalog(required_tables)
+    existing_tables = catalog["table"]
+    missing_tables = catalog["missing"]
     
     if missing_tables:
         print(f"ERROR: Missing tables: {missing_tables}")
-        cursor.close()
-        conn.close()
         return False
     
     print(f"✓ All required tables exist: {len(existing_tables)} tables found")
     
     # Check that views exist
-    cursor.execute("""
-        SELECT table_name 
-        FROM information_schema.views 
-        WHERE table_schema = 'public'
-    """)
-    
-    views = [row[0] for row in cursor.fetchall()]
+    views = catalog["view"]
     print(f"✓ Views created: {len(views)} views found")
     
     # Check that functions exist
-    cursor.execute("""
-        SELECT routine_name 
-        FROM information_schema.routines 
-        WHERE routine_schema = 'public' 
-        AND routine_type = 'FUNCTION'
-    """)
-    
-    functions = [row[0] for row in cursor.fetchall()]
+    functions = catalog["function"]
     print(f"✓ Functions created: {len(functions)} functions found")
     
-    cursor.close()
-    conn.close()
-    
     print("Test database verification completed successfully!")
     return True
 
@@ -173,11 +286,11 @@ def main():
     print("=" * 70)
     
     try:
-        # Step 1: Create test database
-        create_test_database()
+        # Step 1: Build the schema template (skipped if init.sql is unchanged)
+        build_template_db()
         
-        # Step 2: Initialize schema
-        initialize_test_schema()
+        # Step 2: Clone the test database from the template
+        create_test_database()
         
         # Step 3: Verify setup
         if verify_test_database():
@@ -4,21 +4,28 @@ Checks code structure without requiring database connection
 """
 import ast
 import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _parse(filepath):
+    """Parse a Python file once; repeated checks on it reuse the tree"""
+    with open(filepath, 'rb') as f:
+        return ast.parse(f.read())
+
 
 def verify_file_structure(filepath, expected_methods):
     """Verify a Python file has the expected methods"""
-    with open(filepath, 'r') as f:
-        tree = ast.parse(f.read())
+    tree = _parse(filepath)
     
-    # Find all class definitions
-    classes = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+    # Find the first top-level class definition
+    class_node = next((node for node in tree.body if isinstance(node, ast.ClassDef)), None)
     
-    if not classes:
+    if class_node is None:
         return False, "No class found"
     
     # Get methods from the first class
-    class_node = classes[0]
-    methods = [node.name for node in class_node.body if isinstance(node, ast.FunctionDef)]
+    methods = {node.name for node in class_node.body if isinstance(node, ast.FunctionDef)}
     
     # Check if all expected methods exist
     missing = [m for m in expected_methods if m not in methods]
@@ -39,7 +39,10 @@ CREATE TABLE emission_factors (
 );
 
 -- Indexes for performance optimization
-CREATE INDEX idx_emission_factors_lookup ON emission_factors(activity_name, scope, valid_from, valid_to);
+-- Point-in-time factor lookup: keys match its ORDER BY valid_from DESC, created_at DESC
+-- LIMIT 1 and INCLUDE carries the filtered/returned columns for an index-only scan
+CREATE INDEX idx_emission_factors_lookup ON emission_factors(activity_name, scope, valid_from DESC, created_at DESC)
+    INCLUDE (valid_to, factor_id, co2e_per_unit, activity_unit, source);
 CREATE INDEX idx_emission_factors_active ON emission_factors(activity_name, scope) WHERE valid_to IS NULL;
 CREATE INDEX idx_emission_factors_date_range ON emission_factors(valid_from, valid_to);
 
@@ -363,6 +366,23 @@ CREATE TRIGGER update_business_metrics_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- Trigger: Calculate emissions from the referenced factor when not supplied
+CREATE OR REPLACE FUNCTION calc_co2e()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.calculated_co2e := NEW.activity_value * (
+        SELECT co2e_per_unit FROM emission_factors WHERE factor_id = NEW.factor_id
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_calc_co2e
+    BEFORE INSERT ON emission_records
+    FOR EACH ROW
+    WHEN (NEW.calculated_co2e IS NULL)
+    EXECUTE FUNCTION calc_co2e();
+
 -- Trigger: Automatically log overrides to audit_log
 CREATE OR REPLACE FUNCTION log_emission_override()
 RETURNS TRIGGER AS $$